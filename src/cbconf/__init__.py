@@ -3,13 +3,14 @@ from pydantic.fields import Field
 from . import registry
 from .errors import SettingsError
 from .settings import Settings
-from .sources import EnvSource, IniFileSource, SecretsSource, SettingsSource
+from .sources import EnvSource, IniFileSource, SecretsSource, SettingsFieldSource, SettingsSource
 from .validators import DelimitedList, Params
 
 __all__ = [
     "Settings",
     "SettingsError",
     "SettingsSource",
+    "SettingsFieldSource",
     "EnvSource",
     "IniFileSource",
     "SecretsSource",
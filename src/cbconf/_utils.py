@@ -1,6 +1,7 @@
 # Word delimiters and symbols that will not be preserved when re-casing.
 import os
 import re
+from typing import Any, Dict, Mapping
 
 _SYMBOLS = "[^a-zA-Z0-9]*"
 
@@ -10,12 +11,18 @@ _WORD = "[A-Z]*[a-z]*[0-9]*"
 # Uppercase word, not followed by lowercase letters.
 _WORD_UPPER = "[A-Z]+(?![a-z])[0-9]*"
 
+_PASCAL_RE = re.compile(f"({_SYMBOLS})({_WORD_UPPER}|{_WORD})")
+
+# Words only, symbols in between come back as empty matches.
+_WORDS_RE = re.compile(f"{_WORD_UPPER}|{_WORD}")
+
 
 def pascal_case(value: str, strict: bool = True) -> str:
-    def substitute_word(symbols, word):
-        if strict:
-            return word.capitalize()  # Remove all delimiters
+    if strict:
+        return "".join(map(str.capitalize, _WORDS_RE.findall(value)))  # Remove all delimiters
 
+    def substitute_word(match: "re.Match[str]") -> str:
+        symbols, word = match[1], match[2]
         if word.islower():
             delimiter_length = len(symbols[:-1])  # Lose one delimiter
         else:
@@ -23,7 +30,22 @@ def pascal_case(value: str, strict: bool = True) -> str:
 
         return ("_" * delimiter_length) + word.capitalize()
 
-    return re.sub(f"({_SYMBOLS})({_WORD_UPPER}|{_WORD})", lambda groups: substitute_word(groups[1], groups[2]), value,)
+    return _PASCAL_RE.sub(substitute_word, value)
+
+
+def merge_into(target: Dict[str, Any], source: Mapping[str, Any]) -> Dict[str, Any]:
+    """Recursively merge `source` into `target` in place, with `source` taking precedence.
+
+    Nested dicts are only copied where both sides have a dict for the same key, so dicts handed in by
+    `source` are never mutated by later merges.
+    """
+    for key, value in source.items():
+        current = target.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            target[key] = merge_into(dict(current), value)
+        else:
+            target[key] = value
+    return target
 
 
 def get_server_env() -> str:
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from functools import partial
-from typing import Any, Callable, Dict, Optional
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional
 
 from cbconf.sources import EnvSource, IniFileSource, SecretsSource, SettingsSource
 
@@ -17,7 +18,8 @@ class Source:
         self.factory = factory
 
     def configure(self, env: str = "default", **options: Any) -> Source:
-        __registry__[env][self.name] = partial(self.factory, **options)
+        __registry__.setdefault(env, {})[self.name] = partial(self.factory, **options)
+        get_sources.cache_clear()
         return self
 
 
@@ -27,6 +29,7 @@ def register(factory: SourceFactory, name: str, configuration: Optional[Dict[str
 
     __sources__[name] = factory
     __registry__["default"][name] = factory
+    get_sources.cache_clear()
     source = Source(name, factory)
 
     if configuration:
@@ -39,5 +42,12 @@ def configure(name: str, env: str = "default", **options: Any) -> Source:
     if name not in __sources__:
         raise ValueError(f"Settings source '{name}' not registered")
 
-    __registry__[env][name] = partial(__sources__[name], **options)
+    __registry__.setdefault(env, {})[name] = partial(__sources__[name], **options)
+    get_sources.cache_clear()
     return Source(name, __sources__[name])
+
+
+@lru_cache(maxsize=None)
+def get_sources(env: str) -> Mapping[str, Any]:
+    """Source factories for `env`, i.e. the defaults overridden by anything configured for that env."""
+    return MappingProxyType({**__registry__.get("default", {}), **__registry__.get(env, {})})
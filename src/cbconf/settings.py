@@ -1,17 +1,118 @@
 from __future__ import annotations
 
 import inspect
-from typing import Any, Callable, ClassVar, Dict, List, Mapping, Sequence, Tuple, Type, Union
+from functools import partial
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+from weakref import WeakKeyDictionary
 
-from pydantic import BaseConfig, BaseModel, Extra, Field
+from pydantic import BaseConfig, BaseModel, Extra, Field, PrivateAttr, ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import ExtraError, MissingError
 from pydantic.fields import FieldInfo
 from pydantic.main import ModelMetaclass
-from pydantic.utils import deep_update
 from typing_extensions import Self, dataclass_transform
 
 from . import registry as reg
-from ._utils import get_server_env, pascal_case
-from .sources import InitSource, SettingsSource
+from ._utils import get_server_env, merge_into, pascal_case
+from .errors import SettingsError
+from .sources import InitSource, SettingsFieldSource, SettingsSource
+
+_POSITIONAL_KINDS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+_KEYWORD_KINDS = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+
+
+_CONFIG_OPTIONS: "WeakKeyDictionary[type, Mapping[str, Any]]" = WeakKeyDictionary()
+
+
+def _config_options(config: Type[BaseConfig]) -> Mapping[str, Any]:
+    options = _CONFIG_OPTIONS.get(config)
+    if options is None:
+        options = _CONFIG_OPTIONS[config] = MappingProxyType(
+            {n: v for n, v in inspect.getmembers(config) if not n.startswith("_")}
+        )
+    return options
+
+
+_FACTORY_PARAMS: "WeakKeyDictionary[Callable[..., SettingsSource], FrozenSet[str]]" = WeakKeyDictionary()
+
+
+def _factory_params(factory: Callable[..., SettingsSource]) -> FrozenSet[str]:
+    try:
+        params = _FACTORY_PARAMS.get(factory)
+    except TypeError:
+        # unhashable or not weakly referenceable, inspect it every time
+        return _inspect_factory_params(factory)
+
+    if params is None:
+        params = _FACTORY_PARAMS[factory] = _inspect_factory_params(factory)
+    return params
+
+
+def _inspect_factory_params(factory: Callable[..., SettingsSource]) -> FrozenSet[str]:
+    # sources configured through the registry are partials, look at the wrapped factory directly. Options bound
+    # as keywords stay accepted so config values can still override them, only bound positionals are dropped.
+    bound_args = 0
+    if isinstance(factory, partial):
+        bound_args = len(factory.args)
+        factory = factory.func
+
+    params = inspect.signature(factory).parameters.values()
+    positional = [p.name for p in params if p.kind in _POSITIONAL_KINDS]
+    return frozenset(p.name for p in params if p.kind in _KEYWORD_KINDS).difference(positional[:bound_args])
+
+
+class _LazySources:
+    """Looks up single fields across settings sources, merging from the lowest priority source up.
+
+    Sources implementing `SettingsFieldSource` are queried per field, all others are called once and their result
+    is kept for subsequent lookups.
+    """
+
+    def __init__(self, sources: List[SettingsSource]) -> None:
+        self.sources = sources
+        self._getters = [s.get_field if isinstance(s, SettingsFieldSource) else None for s in sources]
+        self._results: Dict[int, Dict[str, Any]] = {}
+
+    def get(self, model: BaseModel, name: str) -> Dict[str, Any]:
+        alias = model.__fields__[name].alias
+        result: Dict[str, Any] = {}
+        for index in reversed(range(len(self.sources))):
+            getter = self._getters[index]
+            if getter is not None:
+                values = getter(model, name)
+            elif index in self._results:
+                values = self._results[index]
+            else:
+                values = self._results[index] = self.sources[index](model)
+
+            if alias in values:
+                merge_into(result, {alias: values[alias]})
+        return result
+
+    def extras(self, model: BaseModel) -> Dict[str, Any]:
+        aliases = {field.alias for field in model.__fields__.values()}
+        result: Dict[str, Any] = {}
+        for index in reversed(range(len(self.sources))):
+            values = self._results.get(index)
+            if values is None:
+                values = self._results[index] = self.sources[index](model)
+            merge_into(result, {k: v for k, v in values.items() if k not in aliases})
+        return result
 
 
 @dataclass_transform(kw_only_default=True, field_descriptors=(Field, FieldInfo))
@@ -37,8 +138,11 @@ class SettingsMeta(ModelMetaclass):
 
         if server_env:
             config_ns = {"env_file": f".env.{server_env}"}
-            config_name = pascal_case(f"{server_env}_config")
-            env_config = ns.get(config_name, None)
+            # env specific config classes are named `<Env>Config`, don't bother deriving the name if there are none
+            if any(n.endswith("Config") and n != "Config" for n in ns):
+                env_config = ns.get(pascal_case(f"{server_env}_config"), None)
+            else:
+                env_config = None
             if isinstance(env_config, type):
                 config_ns.update({n: v for n, v in inspect.getmembers(env_config) if not n.startswith("_")})
         else:
@@ -49,7 +153,12 @@ class SettingsMeta(ModelMetaclass):
         ns["Config"] = type("Config", (self_config,), config_ns)
         ns["__singleton__"] = singleton
         ns["__instances__"] = {}
-        return super().__new__(cls, name, bases, ns)
+        new_cls = super().__new__(cls, name, bases, ns)
+
+        # lazily loaded fields are validated one at a time, there is never a point where root validators could run
+        if new_cls.__config__.lazy_load and (new_cls.__pre_root_validators__ or new_cls.__post_root_validators__):
+            raise SettingsError(f"{name} can't use root validators with lazy_load")
+        return new_cls
 
     def __call__(cls, *args: Any, **kwargs: Any) -> Self:
         if not cls.__singleton__:
@@ -65,6 +174,8 @@ class Settings(BaseModel, metaclass=SettingsMeta):
         sources: Sequence[str] = ()
         server_env: Union[str, Callable[[], str]] = get_server_env
         singleton: bool = True
+        lazy_load: bool = False
+        skip_validation: bool = False
         case_sensitive: bool = False
         validate_all: bool = True
         extra: Extra = Extra.allow
@@ -73,38 +184,191 @@ class Settings(BaseModel, metaclass=SettingsMeta):
 
     __config__: ClassVar[Type[Config]]
 
+    _lazy: Optional[_LazySources] = PrivateAttr(default=None)
+
     def __init__(self, **values: Any) -> None:
+        if self.__config__.lazy_load:
+            self._init_lazy(values)
+            return
+
         values = self._build_values(values)
-        super().__init__(**values)
+        if self.__config__.skip_validation:
+            self._construct(values)
+        else:
+            super().__init__(**values)
 
-    def _build_values(self, values: Dict[str, Any]) -> Dict[str, Any]:
-        default_registry = reg.__registry__.get("default", {})
+    def _construct(self, values: Dict[str, Any]) -> None:
+        # sources are trusted, so populate the instance the same way `construct` would, but still map aliases to
+        # field names, honour `extra` and make sure no required field is missing
+        config = self.__config__
+        fields_values: Dict[str, Any] = {}
+        fields_set = set()
+        names_used = set()
+        errors = []
+        for name, field in self.__fields__.items():
+            if field.alias in values:
+                fields_values[name] = values[field.alias]
+                fields_set.add(name)
+                names_used.add(field.alias)
+            elif config.allow_population_by_field_name and name in values:
+                fields_values[name] = values[name]
+                fields_set.add(name)
+                names_used.add(name)
+            elif field.required:
+                errors.append(ErrorWrapper(MissingError(), loc=field.alias))
+            else:
+                fields_values[name] = field.get_default()
 
-        if callable(self.__config__.server_env):
-            server_env = str(self.__config__.server_env()).lower()
-        elif isinstance(self.__config__.server_env, str):
-            server_env = str(self.__config__.server_env).lower()
+        if config.extra != Extra.ignore:
+            for name in (n for n in values if n not in names_used):
+                if config.extra == Extra.allow:
+                    fields_values[name] = values[name]
+                    fields_set.add(name)
+                else:
+                    errors.append(ErrorWrapper(ExtraError(), loc=name))
+
+        if errors:
+            raise ValidationError(errors, type(self))
+
+        object.__setattr__(self, "__dict__", fields_values)
+        object.__setattr__(self, "__fields_set__", fields_set)
+        self._init_private_attributes()
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            if not name.startswith("_") and self._lazy is not None:
+                if name in self.__fields__:
+                    return self._resolve_lazy(name)
+
+                # could be an extra coming from one of the sources
+                extras = self._lazy.extras(self)
+                if name in extras and self.__config__.extra == Extra.allow:
+                    self.__dict__[name] = extras[name]
+                    self.__fields_set__.add(name)
+                    return extras[name]
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def _iter(self, *args: Any, **kwargs: Any) -> Any:
+        self._resolve_all_lazy()
+        return super()._iter(*args, **kwargs)
+
+    def __repr_args__(self) -> Any:
+        self._resolve_all_lazy()
+        return super().__repr_args__()
+
+    def _init_lazy(self, values: Dict[str, Any]) -> None:
+        object.__setattr__(self, "__dict__", {})
+        object.__setattr__(self, "__fields_set__", set())
+        self._init_private_attributes()
+        object.__setattr__(self, "_lazy", _LazySources(self._build_sources(values)))
+
+        aliases = set()
+        for name, field in self.__fields__.items():
+            aliases.add(field.alias)
+            if field.alias in values and name not in self.__dict__:
+                self._resolve_lazy(name)
+
+        if self.__config__.extra == Extra.allow:
+            for name in values.keys() - aliases:
+                self.__dict__[name] = values[name]
+                self.__fields_set__.add(name)
+
+    def _resolve_all_lazy(self) -> None:
+        if self._lazy is None:
+            return
+
+        for name in self.__fields__:
+            if name not in self.__dict__:
+                self._resolve_lazy(name)
+
+    def _resolve_lazy(self, name: str) -> Any:
+        # like eager validation, validators get `values` holding every valid field declared before this one
+        values: Dict[str, Any] = {}
+        for prior in self.__fields__:
+            if prior == name:
+                break
+            if prior in self.__dict__:
+                values[prior] = self.__dict__[prior]
+                continue
+            try:
+                values[prior] = self._resolve_field(prior, values)
+            except ValidationError:
+                # only reported when the invalid field itself is accessed
+                pass
+
+        value = self._resolve_field(name, values)
+        if self.__fields__.keys() <= self.__dict__.keys():
+            self._finish_lazy()
+        return value
+
+    def _finish_lazy(self) -> None:
+        assert self._lazy is not None
+        extras = self._lazy.extras(self)
+        if extras and self.__config__.extra == Extra.forbid:
+            raise ValidationError([ErrorWrapper(ExtraError(), loc=name) for name in extras], type(self))
+        if self.__config__.extra == Extra.allow:
+            self.__dict__.update(extras)
+            self.__fields_set__.update(extras)
+
+        # every field is loaded, put them back in declaration order, followed by extras
+        fields = self.__fields__
+        ordered = {name: self.__dict__[name] for name in fields}
+        ordered.update((name, value) for name, value in self.__dict__.items() if name not in fields)
+        object.__setattr__(self, "__dict__", ordered)
+        object.__setattr__(self, "_lazy", None)
+
+    def _resolve_field(self, name: str, values: Dict[str, Any]) -> Any:
+        assert self._lazy is not None
+        field = self.__fields__[name]
+        found = self._lazy.get(self, name)
+        if field.alias in found:
+            value = found[field.alias]
+            self.__fields_set__.add(name)
+        elif field.required:
+            raise ValidationError([ErrorWrapper(MissingError(), loc=field.alias)], type(self))
+        else:
+            value = field.get_default()
+            if not self.__config__.validate_all and not field.validate_always:
+                self.__dict__[name] = value
+                return value
+
+        if self.__config__.skip_validation:
+            self.__dict__[name] = value
+            return value
+
+        value, errors = field.validate(value, values, loc=field.alias, cls=type(self))
+        if errors:
+            raise ValidationError([errors], type(self))
+
+        self.__dict__[name] = value
+        return value
+
+    def _build_sources(self, values: Dict[str, Any]) -> List[SettingsSource]:
+        config = self.__config__
+
+        if callable(config.server_env):
+            server_env = str(config.server_env()).lower()
+        elif isinstance(config.server_env, str):
+            server_env = str(config.server_env).lower()
         else:
             server_env = "default"
 
-        env_sources = reg.__registry__.get(server_env, {})
-        sources = {**default_registry, **env_sources}
+        sources = reg.get_sources(server_env)
 
-        if unk := next((x for x in self.__config__.sources if x not in sources), None):
+        if unk := next((x for x in config.sources if x not in sources), None):
             raise ValueError(f"Settings source '{unk}' not found. Did you forget to `register_settings_source`?")
 
-        def exclude(name: str) -> bool:
-            return name.startswith("_")
-
-        options = {n: v for n, v in inspect.getmembers(self.__config__) if not exclude(n)}
-        options["server_env"] = server_env
+        options = {**_config_options(config), "server_env": server_env}
 
         config_sources: List[SettingsSource] = [InitSource(values)]
-        for s in self.__config__.sources:
+        for s in config.sources:
             factory = sources[s]
-            sig = inspect.signature(factory)
-            bound = sig.bind_partial(**{n: v for n, v in options.items() if n in sig.parameters})
-            bound.apply_defaults()
-            config_sources.append(factory(*bound.args, **bound.kwargs))
+            config_sources.append(factory(**{n: options[n] for n in _factory_params(factory) & options.keys()}))
+        return config_sources
 
-        return deep_update(*reversed([source(self) for source in config_sources]))
+    def _build_values(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        for source in reversed(self._build_sources(values)):
+            merge_into(result, source(self))
+        return result
@@ -1,5 +1,6 @@
 import os
 import re
+import time
 import warnings
 from pathlib import Path
 from typing import (
@@ -7,29 +8,81 @@ from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Mapping,
+    NamedTuple,
     Optional,
+    Pattern,
     Protocol,
+    Sequence,
     Tuple,
+    Type,
     Union,
     runtime_checkable,
 )
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel
 from pydantic.fields import ModelField
 from pydantic.typing import StrPath, get_origin, is_union
-from pydantic.utils import deep_update, path_type
+from pydantic.utils import path_type
 from typing_extensions import TypeAlias
 
+from ._utils import merge_into
 from .errors import SettingsError
 
 if TYPE_CHECKING:
+    from configparser import ConfigParser
+
     from .settings import Settings  # noqa
 
 SettingsType: TypeAlias = "Settings"
 
+_ENVIRON_CACHE: Optional[Tuple[Dict[Any, Any], Dict[str, str]]] = None
+_ENV_FILE_CACHE: Dict[Tuple[str, Optional[str], bool], Tuple[Tuple[int, int], Dict[str, Optional[str]]]] = {}
+_SECRETS_CACHE: Dict[Tuple[str, bool], Tuple[int, FrozenSet[str]]] = {}
+_RACY_MTIME_NS = 2_000_000_000
+_INI_CACHE: Dict[Tuple[str, Optional[str]], Tuple[Tuple[int, int], "ConfigParser", Dict[str, Dict[str, str]]]] = {}
+
+
+def _lower_environ() -> Dict[str, str]:
+    """Return `os.environ` with lowercased keys, rebuilt only when the environment has changed.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    global _ENVIRON_CACHE
+
+    # comparing the raw environ data is done in C and is much cheaper than decoding and lowercasing every key
+    data = getattr(os.environ, "_data", None)
+    if not isinstance(data, dict):
+        return {k.lower(): v for k, v in os.environ.items()}
+
+    cached = _ENVIRON_CACHE
+    if cached is not None and cached[0] == data:
+        return cached[1]
+
+    lowered = {k.lower(): v for k, v in os.environ.items()}
+    _ENVIRON_CACHE = (dict(data), lowered)
+    return lowered
+
+
+class _EnvField(NamedTuple):
+    """What `EnvSource` needs to know about a model field, computed once per model."""
+
+    alias: str
+    env_names: Tuple[str, ...]
+    matchfull: Optional[Pattern[str]]
+    is_complex: bool
+    allow_json_failure: bool
+
+
+_ENV_FIELDS: "WeakKeyDictionary[Type[BaseModel], Dict[Tuple[type, Optional[str], bool], Tuple[_EnvField, ...]]]" = (
+    WeakKeyDictionary()
+)
+_SECRET_NAMES: "WeakKeyDictionary[Type[BaseModel], Dict[bool, Dict[str, Tuple[str, ...]]]]" = WeakKeyDictionary()
+
 
 @runtime_checkable
 class SettingsSource(Protocol):
@@ -37,7 +90,15 @@ class SettingsSource(Protocol):
         ...
 
 
-class InitSource(SettingsSource):
+@runtime_checkable
+class SettingsFieldSource(SettingsSource, Protocol):
+    """A source that can also look up a single field, used when settings are lazily loaded."""
+
+    def get_field(self, model: BaseModel, name: str) -> Dict[str, Any]:
+        ...
+
+
+class InitSource(SettingsFieldSource):
     __slots__ = "values"
 
     def __init__(self, values: Dict[str, Any]):
@@ -46,6 +107,10 @@ class InitSource(SettingsSource):
     def __call__(self, model: BaseModel) -> Dict[str, Any]:
         return self.values.copy()
 
+    def get_field(self, model: BaseModel, name: str) -> Dict[str, Any]:
+        alias = model.__fields__[name].alias
+        return {alias: self.values[alias]} if alias in self.values else {}
+
     def __repr__(self) -> str:
         return f"InitSource(values={self.values!r})"
 
@@ -77,7 +142,7 @@ class EnvSource(SettingsSource):
         if self.case_sensitive:
             env_vars: Mapping[str, Optional[str]] = os.environ
         else:
-            env_vars = {k.lower(): v for k, v in os.environ.items()}
+            env_vars = _lower_environ()
 
         if self.env_file is not None:
             env_path = Path(self.env_file).expanduser()
@@ -89,17 +154,17 @@ class EnvSource(SettingsSource):
                     **env_vars,
                 }
 
-        xform = str.lower if not self.case_sensitive else lambda x: x
-
         json_loads = model.__config__.json_loads
+        nested_names: Dict[str, Sequence[str]] = {}
 
-        for field in model.__fields__.values():
+        for field in self._env_fields(model):
             env_val: Optional[str] = None
             env_name: str = ""
 
-            if pattern := field.field_info.extra.get("matchfull", None):
+            if field.matchfull is not None:
+                fullmatch = field.matchfull.fullmatch
                 for k, v in env_vars.items():
-                    if match := re.fullmatch(pattern, k):
+                    if match := fullmatch(k):
                         if field.alias not in d:
                             d[field.alias] = {}
                         groups = match.groups()
@@ -108,42 +173,58 @@ class EnvSource(SettingsSource):
                         else:
                             d[field.alias][groups[1].lower()] = v
             else:
-                env_names = _get_source_names(field, "env", transform=xform)
-                if self.env_prefix:
-                    env_names = [f"{self.env_prefix}{name}" for name in env_names]
-
+                env_names = field.env_names
                 for env_name in env_names:
                     env_val = env_vars.get(env_name)
                     if env_val is not None:
                         break
 
-                is_complex, allow_json_failure = self.field_is_complex(field)
-                if is_complex:
+                if field.is_complex:
+                    # nested env vars for all complex fields are collected in a single pass below
                     if env_val is None:
-                        # field is complex but no value found so far, try explode_env_vars
-                        env_val_built = self.explode_env_vars(env_vars, env_names, self.env_nested_delimiter)
-                        if env_val_built:
-                            d[field.alias] = env_val_built
+                        nested_names[field.alias] = env_names
                     else:
-                        # field is complex and there's a value, decode that as JSON, then add explode_env_vars
+                        # field is complex and there's a value, decode that as JSON, then add nested env vars
                         try:
                             env_val = json_loads(env_val)
                         except ValueError as e:
-                            if not allow_json_failure:
+                            if not field.allow_json_failure:
                                 raise SettingsError(f'error parsing JSON for "{env_name}"') from e
-
+                        d[field.alias] = env_val
                         if isinstance(env_val, dict):
-                            d[field.alias] = deep_update(
-                                env_val, self.explode_env_vars(env_vars, env_names, self.env_nested_delimiter)
-                            )
-                        else:
-                            d[field.alias] = env_val
+                            nested_names[field.alias] = env_names
                 elif env_val is not None:
                     # simplest case, field is not complex, we only need to add the value if it was found
                     d[field.alias] = env_val
 
+        if nested_names:
+            for alias, env_val_built in self._explode_nested_env_vars(env_vars, nested_names).items():
+                if alias in d:
+                    # the decoded JSON value is owned by this call, so nested values are merged into it in place
+                    merge_into(d[alias], env_val_built)
+                else:
+                    d[alias] = env_val_built
+
         return d
 
+    def _env_fields(self, model: BaseModel) -> Tuple["_EnvField", ...]:
+        model_fields = _ENV_FIELDS.setdefault(type(model), {})
+        cache_key = (type(self), self.env_prefix, self.case_sensitive)
+        env_fields = model_fields.get(cache_key)
+        if env_fields is None:
+            env_fields = model_fields[cache_key] = tuple(self._env_field(field) for field in model.__fields__.values())
+        return env_fields
+
+    def _env_field(self, field: ModelField) -> "_EnvField":
+        if pattern := field.field_info.extra.get("matchfull", None):
+            return _EnvField(field.alias, (), re.compile(pattern), False, False)
+
+        is_complex, allow_json_failure = self.field_is_complex(field)
+        env_names = _get_source_names(field, "env", transform=str.lower if not self.case_sensitive else None)
+        if self.env_prefix:
+            env_names = tuple(f"{self.env_prefix}{name}" for name in env_names)
+        return _EnvField(field.alias, env_names, None, is_complex, allow_json_failure)
+
     def field_is_complex(self, field: ModelField) -> Tuple[bool, bool]:
         if field.is_complex():
             allow_json_failure = False
@@ -155,21 +236,25 @@ class EnvSource(SettingsSource):
         return True, allow_json_failure
 
     def explode_env_vars(
-        self, env_vars: Mapping[str, Optional[str]], env_names: List[str], env_nested_delimiter: Optional[str]
+        self, env_vars: Mapping[str, Optional[str]], env_names: Sequence[str], env_nested_delimiter: Optional[str]
     ) -> Dict[str, Any]:
-        env_nested_delimiter = env_nested_delimiter or ""
-        prefixes = [f"{env_name}{env_nested_delimiter}" for env_name in env_names]
-        result: Dict[str, Any] = {}
-        for env_name, env_val in env_vars.items():
-            if not any(env_name.startswith(prefix) for prefix in prefixes):
-                continue
-            _, *keys, last_key = env_name.split(env_nested_delimiter)
-            env_var = result
-            for key in keys:
-                env_var = env_var.setdefault(key, {})
-            env_var[last_key] = env_val
+        return _explode_env_vars(env_vars, {"": env_names}, env_nested_delimiter).get("", {})
 
-        return result
+    def _explode_nested_env_vars(
+        self, env_vars: Mapping[str, Optional[str]], field_env_names: Mapping[str, Sequence[str]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Like `explode_env_vars`, but for several fields at once with a single scan of `env_vars`.
+
+        Subclasses overriding `explode_env_vars` keep having it called once per field instead.
+        """
+        if type(self).explode_env_vars is not EnvSource.explode_env_vars:
+            result = {}
+            for alias, env_names in field_env_names.items():
+                if env_val_built := self.explode_env_vars(env_vars, env_names, self.env_nested_delimiter):
+                    result[alias] = env_val_built
+            return result
+
+        return _explode_env_vars(env_vars, field_env_names, self.env_nested_delimiter)
 
     def _read_env_file(
         self, file_path: StrPath, *, encoding: Optional[str] = None, case_sensitive: bool = False,
@@ -179,11 +264,22 @@ class EnvSource(SettingsSource):
         except ImportError as e:
             raise ImportError("python-dotenv is not installed") from e
 
-        file_vars: Dict[str, Optional[str]] = dotenv_values(file_path, encoding=encoding or "utf8")
+        # the same file can be reached through different relative paths, so the cache is keyed on the resolved one
+        resolved = Path(file_path).resolve()
+        stat = resolved.stat()
+        cache_key = (str(resolved), encoding, case_sensitive)
+        cached = _ENV_FILE_CACHE.get(cache_key)
+        if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+            return cached[1]
+
+        file_vars: Dict[str, Optional[str]] = dotenv_values(resolved, encoding=encoding or "utf8")
         if not case_sensitive:
-            return {k.lower(): v for k, v in file_vars.items()}
-        else:
-            return file_vars
+            file_vars = {k.lower(): v for k, v in file_vars.items()}
+
+        # a file modified within `_RACY_MTIME_NS` could change again without its mtime or size changing
+        if time.time_ns() - stat.st_mtime_ns > _RACY_MTIME_NS:
+            _ENV_FILE_CACHE[cache_key] = ((stat.st_mtime_ns, stat.st_size), file_vars)
+        return file_vars
 
     def __repr__(self) -> str:
         return (
@@ -192,54 +288,119 @@ class EnvSource(SettingsSource):
         )
 
 
-class SecretsSource(SettingsSource):
+class SecretsSource(SettingsFieldSource):
     def __init__(self, secrets_dir: Optional[StrPath] = None, case_sensitive: bool = False) -> None:
         self.secrets_dir = secrets_dir
         self.case_sensitive = case_sensitive
+        self._listing: Optional[Tuple[Optional[Path], FrozenSet[str]]] = None
 
-    def __call__(self, model: BaseModel) -> Dict[str, Any]:  # noqa: C901
+    def __call__(self, model: BaseModel) -> Dict[str, Any]:
         secrets: Dict[str, Optional[str]] = {}
 
-        if self.secrets_dir is None:
+        secrets_path, names = self._secrets_listing()
+        if secrets_path is None:
             return secrets
 
+        source_names = self._source_names(model)
+        for name, field in model.__fields__.items():
+            self._read_secret(model, field, source_names[name], secrets_path, names, secrets)
+
+        return secrets
+
+    def get_field(self, model: BaseModel, name: str) -> Dict[str, Any]:
+        secrets: Dict[str, Optional[str]] = {}
+
+        secrets_path, names = self._secrets_listing()
+        if secrets_path is not None:
+            env_names = self._source_names(model)[name]
+            self._read_secret(model, model.__fields__[name], env_names, secrets_path, names, secrets)
+
+        return secrets
+
+    def _secrets_listing(self) -> Tuple[Optional[Path], FrozenSet[str]]:
+        # sources are built for every settings instance, the directory is only checked and listed once per source
+        if self._listing is None:
+            secrets_path = self._secrets_path()
+            names = self._secret_names(secrets_path) if secrets_path is not None else frozenset()
+            self._listing = (secrets_path, names)
+        return self._listing
+
+    def _secrets_path(self) -> Optional[Path]:
+        if self.secrets_dir is None:
+            return None
+
         secrets_path = Path(self.secrets_dir).expanduser()
 
         if not secrets_path.exists():
             warnings.warn(f'directory "{secrets_path}" does not exist')
-            return secrets
+            return None
 
         if not secrets_path.is_dir():
             raise SettingsError(f"secrets_dir must reference a directory, not a {path_type(secrets_path)}")
 
-        xform = str.lower if not self.case_sensitive else None
-        json_loads = model.__config__.json_loads
-
-        for field in model.__fields__.values():
-            env_names = _get_source_names(field, "env", transform=xform)
-            for env_name in env_names:
-                path = secrets_path / env_name
-                if path.is_file():
-                    secret_value = path.read_text().strip()
-                    if field.is_complex():
-                        try:
-                            secret_value = json_loads(secret_value)
-                        except ValueError as e:
-                            raise SettingsError(f'error parsing JSON for "{env_name}"') from e
-
-                    secrets[field.alias] = secret_value
-                elif path.exists():
-                    warnings.warn(
-                        f'attempted to load secret file "{path}" but found a {path_type(path)} instead.', stacklevel=4,
-                    )
-
-        return secrets
+        return secrets_path
+
+    def _source_names(self, model: BaseModel) -> Dict[str, Tuple[str, ...]]:
+        model_names = _SECRET_NAMES.setdefault(type(model), {})
+        source_names = model_names.get(self.case_sensitive)
+        if source_names is None:
+            xform = str.lower if not self.case_sensitive else None
+            source_names = model_names[self.case_sensitive] = {
+                name: _get_source_names(field, "env", transform=xform) for name, field in model.__fields__.items()
+            }
+        return source_names
+
+    def _secret_names(self, secrets_path: Path) -> FrozenSet[str]:
+        """Names of the entries in `secrets_path`, lowercased unless case sensitive.
+
+        The listing is reused while the directory's mtime is unchanged. A listing taken within `_RACY_MTIME_NS` of
+        the last change is not cached, since an entry added in the same mtime tick would go unnoticed.
+        """
+        mtime_ns = secrets_path.stat().st_mtime_ns
+        cache_key = (str(secrets_path), self.case_sensitive)
+        cached = _SECRETS_CACHE.get(cache_key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        names = os.listdir(secrets_path)
+        snapshot = frozenset(names if self.case_sensitive else (name.lower() for name in names))
+        if time.time_ns() - mtime_ns > _RACY_MTIME_NS:
+            _SECRETS_CACHE[cache_key] = (mtime_ns, snapshot)
+        return snapshot
+
+    def _read_secret(
+        self,
+        model: BaseModel,
+        field: ModelField,
+        env_names: Tuple[str, ...],
+        secrets_path: Path,
+        names: FrozenSet[str],
+        secrets: Dict[str, Optional[str]],
+    ) -> None:
+        for env_name in env_names:
+            if env_name not in names:
+                # nothing with that name in the directory listing, skip the stat calls
+                continue
+            path = secrets_path / env_name
+            if path.is_file():
+                secret_value = path.read_text().strip()
+                if field.is_complex():
+                    try:
+                        secret_value = model.__config__.json_loads(secret_value)
+                    except ValueError as e:
+                        raise SettingsError(f'error parsing JSON for "{env_name}"') from e
+
+                secrets[field.alias] = secret_value
+            elif path.exists():
+                warnings.warn(
+                    f'attempted to load secret file "{path}" but found a {path_type(path)} instead.', stacklevel=5,
+                )
 
     def __repr__(self) -> str:
         return f"SecretsSource(secrets_dir={self.secrets_dir!r})"
 
 
-class IniFileSource(SettingsSource):
+class IniFileSource(SettingsFieldSource):
     ini_file: Optional[StrPath]
     ini_file_encoding: Optional[str]
     ini_default_section: Optional[str]
@@ -256,11 +417,40 @@ class IniFileSource(SettingsSource):
         self.ini_file_encoding = ini_file_encoding
         self.ini_default_section = ini_default_section
         self.case_sensitive = case_sensitive
+        self._ini: Optional[Tuple["ConfigParser", Dict[str, Dict[str, str]], str]] = None
 
-    def __call__(self, model: BaseModel) -> Dict[str, Any]:  # noqa: C901
+    def __call__(self, model: BaseModel) -> Dict[str, Any]:
+        if self.ini_file is None:
+            return {}
+
+        parser, sections, ini_default_section = self._read_ini_file()
+
+        result: Dict[str, Any] = {}
+        for field in model.__fields__.values():
+            if value := self._read_value(parser, sections, ini_default_section, field):
+                result[field.alias] = value
+
+        return result
+
+    def get_field(self, model: BaseModel, name: str) -> Dict[str, Any]:
         if self.ini_file is None:
             return {}
 
+        parser, sections, ini_default_section = self._read_ini_file()
+
+        field = model.__fields__[name]
+        if value := self._read_value(parser, sections, ini_default_section, field):
+            return {field.alias: value}
+        return {}
+
+    def _read_ini_file(self) -> Tuple["ConfigParser", Dict[str, Dict[str, str]], str]:
+        # sources are built for every settings instance, the file is only checked and read once per source
+        if self._ini is None:
+            self._ini = self._load_ini_file()
+        return self._ini
+
+    def _load_ini_file(self) -> Tuple["ConfigParser", Dict[str, Dict[str, str]], str]:
+        assert self.ini_file is not None
         ini_file = Path(self.ini_file).expanduser()
         if not ini_file.exists():
             raise SettingsError(f'ini_file "{ini_file}" does not exist')
@@ -268,10 +458,21 @@ class IniFileSource(SettingsSource):
         if not ini_file.is_file():
             raise SettingsError(f'ini_file "{ini_file}" is not a file')
 
-        from configparser import ConfigParser
+        # like the secrets listing, a file changed within `_RACY_MTIME_NS` of being parsed is not cached, since a
+        # rewrite in the same mtime tick keeping the same size would go unnoticed
+        stat = ini_file.stat()
+        cache_key = (str(ini_file), self.ini_file_encoding)
+        cached = _INI_CACHE.get(cache_key)
+        if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+            _, parser, sections = cached
+        else:
+            from configparser import ConfigParser
 
-        parser = ConfigParser()
-        parser.read(ini_file, encoding=self.ini_file_encoding)
+            parser = ConfigParser()
+            parser.read(ini_file, encoding=self.ini_file_encoding)
+            sections = {}
+            if time.time_ns() - stat.st_mtime_ns > _RACY_MTIME_NS:
+                _INI_CACHE[cache_key] = ((stat.st_mtime_ns, stat.st_size), parser, sections)
 
         ini_default_section = self.ini_default_section
         if ini_default_section is None:
@@ -279,27 +480,74 @@ class IniFileSource(SettingsSource):
         elif ini_default_section not in parser.sections():
             raise SettingsError(f'ini_default_section "{ini_default_section}" does not exist')
 
-        result: Dict[str, Any] = {}
-        for field in model.__fields__.values():
-            section = field.field_info.extra.get("ini_section", ini_default_section)
-            key = field.field_info.extra.get("ini", field.name)
-
-            if not self.case_sensitive:
-                section = section.lower()
-                key = key.lower()
-
-            if value := parser.get(section, key, raw=True, fallback=None):
-                result[field.alias] = value
-
-        return result
-
-
-def _get_source_names(field: ModelField, extra: str, *, transform: Optional[Callable[[str], str]] = None) -> List[str]:
+        return parser, sections, ini_default_section
+
+    def _read_value(
+        self, parser: "ConfigParser", sections: Dict[str, Dict[str, str]], ini_default_section: str, field: ModelField
+    ) -> Optional[str]:
+        section = field.field_info.extra.get("ini_section", ini_default_section)
+        key = field.field_info.extra.get("ini", field.name)
+
+        if not self.case_sensitive:
+            section = section.lower()
+            key = key.lower()
+
+        # snapshot each section once, lookups are then plain dict gets instead of going through `parser.get`
+        values = sections.get(section)
+        if values is None:
+            from configparser import NoSectionError
+
+            try:
+                values = dict(parser.items(section, raw=True))
+            except NoSectionError:
+                values = {}
+            sections[section] = values
+
+        return values.get(parser.optionxform(key))
+
+
+def _explode_env_vars(
+    env_vars: Mapping[str, Optional[str]], field_env_names: Mapping[str, Sequence[str]], delimiter: Optional[str]
+) -> Dict[str, Dict[str, Any]]:
+    """Explode nested env vars for every entry of `field_env_names` with a single scan of `env_vars`."""
+    if not delimiter:
+        return {}
+
+    owners: Dict[str, List[str]] = {}
+    for owner, env_names in field_env_names.items():
+        for env_name in env_names:
+            owners.setdefault(f"{env_name}{delimiter}", []).append(owner)
+
+    prefixes = tuple(owners)
+    result: Dict[str, Dict[str, Any]] = {}
+    for env_name, env_val in env_vars.items():
+        if not env_name.startswith(prefixes):
+            continue
+
+        seen = set()
+        for prefix in prefixes:
+            if not env_name.startswith(prefix):
+                continue
+            # split what follows the prefix, so delimiters inside the prefix itself don't produce keys
+            *keys, last_key = env_name[len(prefix) :].split(delimiter)
+            for owner in owners[prefix]:
+                if owner in seen:
+                    continue
+                seen.add(owner)
+                env_var = result.setdefault(owner, {})
+                for key in keys:
+                    env_var = env_var.setdefault(key, {})
+                env_var[last_key] = env_val
+
+    return result
+
+
+def _get_source_names(
+    field: ModelField, extra: str, *, transform: Optional[Callable[[str], str]] = None
+) -> Tuple[str, ...]:
     source_names: Union[str, Iterable[str]] = field.field_info.extra.get(extra, field.name)
     if isinstance(source_names, str):
         source_names = [source_names]
-    else:
-        source_names = list(source_names)
     if transform is not None:
-        source_names = [transform(name) for name in source_names]
-    return source_names
+        return tuple(transform(name) for name in source_names)
+    return tuple(source_names)
@@ -1,7 +1,15 @@
-from collections import Counter
-from typing import Any, Callable, Dict, Generic, Iterable, Iterator, MutableMapping, TypeVar
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, MutableMapping, Optional, Tuple, TypeVar
 from urllib.parse import parse_qs, urlencode
 
+_PARAMS_SEPARATORS = ("&", ",", ";", "\n")
+_LIST_DELIMITERS = (",", "\n", ";", "&")
+
+
+def _most_common(value: str, candidates: Tuple[str, ...], default: str) -> str:
+    # most frequent candidate, ties going to the one that appears first in `value`
+    separator = max(candidates, key=lambda c: (value.count(c), -value.find(c)))
+    return separator if separator in value else default
+
 
 class Params(MutableMapping[str, Any]):
     @classmethod
@@ -13,9 +21,8 @@ class Params(MutableMapping[str, Any]):
         if not v:
             return cls()
 
-        order = ["&", ",", ";", "\n"]
         if isinstance(v, str):
-            separator = next((k for k, _ in Counter(v).most_common() if k in order), "&")
+            separator = _most_common(v, _PARAMS_SEPARATORS, "&")
             return cls(parse_qs(v, separator=separator), separator=separator)
 
         if isinstance(v, dict):
@@ -25,8 +32,8 @@ class Params(MutableMapping[str, Any]):
 
     _params: Dict[str, Any]
 
-    def __init__(self, value: Dict[str, Any] = {}, *, separator: str = "&") -> None:
-        self._params = value
+    def __init__(self, value: Optional[Dict[str, Any]] = None, *, separator: str = "&") -> None:
+        self._params = {} if value is None else value
         self._separator = separator
 
     def __getitem__(self, key: str):
@@ -45,7 +52,11 @@ class Params(MutableMapping[str, Any]):
         return len(self._params)
 
     def __str__(self) -> str:
-        return urlencode(self._params, doseq=True).replace("&", self._separator)
+        encoded = urlencode(self._params, doseq=True)
+        if self._separator == "&":
+            return encoded
+        # a literal "&" inside keys or values is percent-encoded, so every remaining one is a pair separator
+        return encoded.replace("&", self._separator)
 
 
 _T = TypeVar("_T")
@@ -58,19 +69,18 @@ class DelimitedList(Generic[_T]):
 
     @classmethod
     def validate(cls, v: Any) -> Any:
-        order = [",", "\n", ";", "&"]
-        separator = next((k for k, _ in Counter(v).most_common() if k in order), ",")
         if isinstance(v, str):
             if not v:
                 return cls()
 
+            separator = _most_common(v, _LIST_DELIMITERS, ",")
             return cls([x.strip() for x in v.split(separator)], delimiter=separator)
 
         return v
 
-    def __init__(self, value: Iterable[_T] = [], *, delimiter: str = ",") -> None:
+    def __init__(self, value: Iterable[_T] = (), *, delimiter: str = ",") -> None:
         self._delimiter = delimiter
-        self._list = [x for x in value] if not isinstance(value, list) else value
+        self._list = value if isinstance(value, list) else list(value)
 
     def __iter__(self) -> Iterator[_T]:
         return iter(self._list)
@@ -0,0 +1,30 @@
+from typing import Any, Dict
+
+from pydantic import BaseModel
+
+from cbconf import EnvSource
+
+
+class Nested(BaseModel):
+    foo: Dict[str, Any] = {}
+
+
+def test_nested_delimiter_inside_prefix(monkeypatch):
+    monkeypatch.setenv("APP_FOO_BAR", "1")
+    source = EnvSource(env_prefix="app_", env_nested_delimiter="_", case_sensitive=False)
+
+    assert source(Nested()) == {"foo": {"bar": "1"}}
+
+
+def test_explode_without_delimiter():
+    source = EnvSource()
+
+    assert source.explode_env_vars({"foo__bar": "1"}, ["foo"], None) == {}
+
+
+def test_json_null_is_kept(monkeypatch):
+    monkeypatch.setenv("FOO", "null")
+    monkeypatch.setenv("FOO__BAR", "1")
+    source = EnvSource(env_nested_delimiter="__", case_sensitive=False)
+
+    assert source(Nested()) == {"foo": None}
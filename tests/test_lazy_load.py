@@ -0,0 +1,131 @@
+import json
+from typing import Any, Dict, List
+
+import pytest
+from pydantic import BaseModel, ValidationError, root_validator, validator
+
+from cbconf import Settings, SettingsError, SettingsFieldSource, registry
+
+
+class RecordingSource(SettingsFieldSource):
+    """Serves fixed values and records which fields were looked up."""
+
+    values: Dict[str, Any] = {"a": "1", "b": "2", "from_source": "extra"}
+    lookups: List[str] = []
+
+    def __call__(self, model: BaseModel) -> Dict[str, Any]:
+        self.lookups.append("*")
+        return dict(self.values)
+
+    def get_field(self, model: BaseModel, name: str) -> Dict[str, Any]:
+        self.lookups.append(name)
+        alias = model.__fields__[name].alias
+        return {alias: self.values[alias]} if alias in self.values else {}
+
+
+registry.register(RecordingSource, "lazy_recording")
+
+
+@pytest.fixture(autouse=True)
+def clear_lookups():
+    RecordingSource.lookups.clear()
+
+
+class Lazy(Settings, singleton=False, lazy_load=True, sources=["lazy_recording"]):
+    a: int = 0
+    b: int = 0
+    c: int = 0
+
+    @validator("c", always=True)
+    def total(cls, v, values):
+        return values["a"] + values["b"]
+
+
+class LazyRequired(Settings, singleton=False, lazy_load=True, sources=["lazy_recording"]):
+    a: int = 0
+    required: int
+    b: int = 0
+
+
+def test_fields_are_loaded_on_first_access():
+    settings = Lazy()
+    assert RecordingSource.lookups == []
+
+    assert settings.a == 1
+    assert RecordingSource.lookups == ["a"]
+
+    assert settings.a == 1
+    assert RecordingSource.lookups == ["a"]
+
+
+def test_fields_declared_earlier_are_loaded_first():
+    settings = Lazy()
+
+    assert settings.b == 2
+    assert RecordingSource.lookups == ["a", "b"]
+    assert list(settings.__dict__) == ["a", "b"]
+
+
+def test_validators_see_earlier_values():
+    assert Lazy().c == 3
+    assert Lazy(b=5).c == 6
+
+
+def test_dict_and_json_follow_declaration_order():
+    settings = Lazy()
+    assert settings.c == 3
+
+    assert list(settings.dict()) == ["a", "b", "c", "from_source"]
+    assert json.loads(settings.json()) == {"a": 1, "b": 2, "c": 3, "from_source": "extra"}
+    assert list(settings.__dict__) == ["a", "b", "c", "from_source"]
+
+
+def test_repr_loads_everything():
+    assert repr(Lazy()) == "Lazy(a=1, b=2, c=3, from_source='extra')"
+
+
+def test_extras():
+    settings = Lazy(from_init="init")
+
+    assert settings.from_init == "init"
+    assert settings.from_source == "extra"
+    assert not hasattr(settings, "missing")
+    assert settings.dict()["from_init"] == "init"
+
+
+def test_missing_required_field():
+    settings = LazyRequired()
+
+    # a missing field declared earlier doesn't stop later fields from loading
+    assert settings.b == 2
+
+    with pytest.raises(ValidationError) as exc_info:
+        settings.required
+    assert exc_info.value.errors() == [{"loc": ("required",), "msg": "field required", "type": "value_error.missing"}]
+
+    with pytest.raises(ValidationError):
+        settings.dict()
+
+
+def test_root_validators_are_rejected():
+    with pytest.raises(SettingsError):
+
+        class WithRootValidator(Settings, singleton=False, lazy_load=True):
+            a: int = 0
+
+            @root_validator
+            def check(cls, values):
+                return values
+
+
+class LazyTrusted(Settings, singleton=False, lazy_load=True, skip_validation=True, sources=["lazy_recording"]):
+    a: int = 0
+    missing: int = 0
+
+
+def test_skip_validation():
+    settings = LazyTrusted()
+
+    assert settings.a == "1"
+    assert settings.missing == 0
+    assert settings.__fields_set__ == {"a", "b", "from_source"}
@@ -0,0 +1,23 @@
+import pytest
+
+from cbconf import EnvSource, registry
+
+
+@pytest.fixture(autouse=True)
+def restore_registry():
+    saved = {env: dict(sources) for env, sources in registry.__registry__.items()}
+    yield
+    registry.__registry__.clear()
+    registry.__registry__.update(saved)
+    registry.get_sources.cache_clear()
+
+
+def test_configure_unknown_env():
+    assert registry.get_sources("registry_test")["env"] is EnvSource
+
+    registry.configure("env", "registry_test", env_prefix="test_")
+
+    factory = registry.get_sources("registry_test")["env"]
+    assert factory.func is EnvSource
+    assert factory.keywords == {"env_prefix": "test_"}
+    assert registry.get_sources("default")["env"] is EnvSource
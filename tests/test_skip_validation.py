@@ -0,0 +1,64 @@
+import pytest
+from pydantic import Extra, ValidationError
+
+from cbconf import Field, Settings
+
+
+class Trusted(Settings, singleton=False, skip_validation=True):
+    required: int
+    optional: int = 2
+
+
+def test_values_are_assigned_without_validation():
+    settings = Trusted(required="1")
+
+    assert settings.required == "1"
+    assert settings.optional == 2
+    assert settings.__fields_set__ == {"required"}
+
+
+def test_missing_required_field_raises():
+    with pytest.raises(ValidationError) as exc_info:
+        Trusted()
+
+    assert exc_info.value.errors() == [{"loc": ("required",), "msg": "field required", "type": "value_error.missing"}]
+
+
+class Aliased(Settings, singleton=False, skip_validation=True):
+    value: int = Field(1, alias="VALUE")
+
+
+class Forbidden(Settings, singleton=False, skip_validation=True, extra=Extra.forbid):
+    value: int = 1
+
+
+class Ignored(Settings, singleton=False, skip_validation=True, extra=Extra.ignore):
+    value: int = 1
+
+
+def test_aliases_are_mapped_to_field_names():
+    settings = Aliased(VALUE="2")
+
+    assert settings.value == "2"
+    assert settings.__dict__ == {"value": "2"}
+    assert settings.__fields_set__ == {"value"}
+
+
+def test_extras_are_kept_when_allowed():
+    settings = Aliased(other="x")
+
+    assert settings.__dict__ == {"value": 1, "other": "x"}
+    assert settings.__fields_set__ == {"other"}
+
+
+def test_extras_are_dropped_when_ignored():
+    assert Ignored(value="2", other="x").__dict__ == {"value": "2"}
+
+
+def test_extras_raise_when_forbidden():
+    with pytest.raises(ValidationError) as exc_info:
+        Forbidden(other="x")
+
+    assert exc_info.value.errors() == [
+        {"loc": ("other",), "msg": "extra fields not permitted", "type": "value_error.extra"}
+    ]
@@ -0,0 +1,17 @@
+from cbconf import DelimitedList, Params
+
+
+def test_params_instances_dont_share_a_default_store():
+    first = Params()
+    first["a"] = "1"
+
+    assert dict(Params()) == {}
+    assert dict(Params.validate("")) == {}
+
+
+def test_delimited_list_instances_dont_share_a_default_store():
+    first = DelimitedList()
+    first.insert(0, "a")
+
+    assert list(DelimitedList()) == []
+    assert list(DelimitedList.validate("")) == []